@@ -1,8 +1,28 @@
+import importlib
 import pickle
 from pathlib import Path
-from typing import Tuple, Dict
+from typing import Dict, Tuple
 
-from packets import Packet
+from telemetry_f1_2021.packets import HEADER_FIELD_TO_PACKET_TYPE, Packet, PacketHeader
+
+# Globals a packet pickle is allowed to reference: the packet classes
+# themselves plus the ctypes reconstruction hook they pickle through.
+# Anything else in a .pickle file is refused instead of executed.
+_ALLOWED_GLOBALS = {('_ctypes', '_unpickle')} | {
+    (cls.__module__, cls.__name__) for cls in HEADER_FIELD_TO_PACKET_TYPE.values()
+}
+
+
+class SafeUnpickler(pickle.Unpickler):
+    """Unpickler that only resolves the known packet classes."""
+
+    def find_class(self, module, name):
+        if (module, name) not in _ALLOWED_GLOBALS:
+            raise pickle.UnpicklingError(
+                f'refusing to load {module}.{name} from packet pickle'
+            )
+
+        return getattr(importlib.import_module(module), name)
 
 
 class PacketLoader:
@@ -10,12 +30,25 @@ class PacketLoader:
 
         if not path_to_packets:
             self.path_to_packets = Path(__file__).parent
+        else:
+            self.path_to_packets = Path(path_to_packets)
 
         self.packets: Dict[Tuple, Packet] = {}
 
     def fetch_packets(self):
+        # Raw captures: the file is the datagram, so peek the header for
+        # the packet type and overlay it with one C-level copy.
+        for packet in self.path_to_packets.glob(pattern='*.bin'):
+            data = packet.read_bytes()
+            header = PacketHeader.peek(data)
+            packet_type = HEADER_FIELD_TO_PACKET_TYPE[header[0], header[3], header[4]]
+            self.packets[f"{str(packet).replace('.bin', '')}"] = (
+                packet_type.from_buffer_copy(data)
+            )
+
+        # Legacy pickled captures, still loaded through the allow-list.
         for packet in self.path_to_packets.glob(pattern='*.pickle'):
             with open(packet, 'rb') as raw_data:
-                packet_data = pickle.load(raw_data)
+                packet_data = SafeUnpickler(raw_data).load()
                 self.packets[f"{str(packet).replace('.pickle', '')}"] = packet_data
         return self.packets
@@ -2,9 +2,35 @@
 Basic listener to read the UDP packet and convert it to a known packet format.
 """
 
+import ctypes
+import logging
+import select
 import socket
 
 from telemetry_f1_2021.packets import PacketHeader, HEADER_FIELD_TO_PACKET_TYPE
+from telemetry_f1_2021.packets import PACKET_BY_ID, SIZE_BY_ID
+from telemetry_f1_2021.packets import (
+    PACKET_FORMAT_2021_LE,
+    PACKET_FORMAT_OFFSET,
+    PACKET_ID_OFFSET,
+)
+
+# Largest 2021 packet (PacketMotionData) is ~1.5KB; one reusable buffer
+# of this size fits any datagram the game sends.
+BUFFER_SIZE = 2048
+
+# Non-blocking receive flag; not available on all platforms (Windows),
+# in which case a zero-timeout select gates each drain read instead.
+_MSG_DONTWAIT = getattr(socket, 'MSG_DONTWAIT', 0)
+
+# Ask the kernel for a deep receive queue so bursts survive short stalls
+# in the Python consumer instead of being dropped silently.
+RECV_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Number of receive buffers cycled through by the listener.
+POOL_SIZE = 8
+
+logger = logging.getLogger(__name__)
 
 
 class TelemetryListener:
@@ -18,12 +44,128 @@ class TelemetryListener:
             host = ''
 
         self.socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+
+        # SO_REUSEPORT lets several listener processes share the port;
+        # must be set before bind and doesn't exist on every platform.
+        if hasattr(socket, 'SO_REUSEPORT'):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER_SIZE)
+        effective = self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+
+        if effective < RECV_BUFFER_SIZE:
+            logger.info(
+                'SO_RCVBUF capped at %d bytes by the kernel (asked for %d); '
+                'raise net.core.rmem_max to avoid drops under bursts',
+                effective,
+                RECV_BUFFER_SIZE,
+            )
+
         self.socket.bind((host, port))
 
+        # Receive into a small ring of preallocated buffers instead of a
+        # fresh bytes object per datagram. Cycling the ring means a
+        # packet returned by get() stays valid for the next
+        # POOL_SIZE - 1 receives, e.g. to pair motion and lap data for
+        # the same frame, still without any allocation on the hot path.
+        self._pool = [(ctypes.c_uint8 * BUFFER_SIZE)() for _ in range(POOL_SIZE)]
+        self._pool_index = 0
+        self._buffer = self._pool[0]
+
+    def _next_buffer(self):
+        """Advances the ring and returns the buffer to receive into."""
+        self._pool_index = (self._pool_index + 1) % POOL_SIZE
+        self._buffer = self._pool[self._pool_index]
+
+        return self._buffer
+
+    def _recv(self):
+        """Receives the next valid datagram and returns its packet class."""
+        while True:
+            received = self.socket.recv_into(self._next_buffer())
+            packet_type = self._dispatch(received)
+
+            if packet_type is not None:
+                return packet_type
+
+    def _dispatch(self, received):
+        """Returns the packet class for the datagram in the buffer.
+
+        Returns None for a datagram whose length doesn't match the
+        declared packet id - truncated or corrupt data that
+        from_buffer would otherwise happily overlay.
+        """
+        buffer = self._buffer
+
+        # The usual case costs three byte reads and a tuple index - no
+        # header unpack at all. The length check is a single integer
+        # compare against the precomputed size table.
+        if (
+            buffer[PACKET_FORMAT_OFFSET] == PACKET_FORMAT_2021_LE[0]
+            and buffer[PACKET_FORMAT_OFFSET + 1] == PACKET_FORMAT_2021_LE[1]
+        ):
+            packet_id = buffer[PACKET_ID_OFFSET]
+
+            if packet_id >= len(SIZE_BY_ID) or received != SIZE_BY_ID[packet_id]:
+                logger.warning(
+                    'dropping %d-byte datagram for packet id %d',
+                    received,
+                    packet_id,
+                )
+                return None
+
+            return PACKET_BY_ID[packet_id]
+
+        # Unknown format: unpack the header to a plain tuple in one C
+        # call (indices: 0 = format, 3 = version, 4 = id) and take the
+        # mapping route.
+        header = PacketHeader.peek(buffer)
+
+        return HEADER_FIELD_TO_PACKET_TYPE[header[0], header[3], header[4]]
+
     def get(self):
-        packet = self.socket.recv(2048)
-        header = PacketHeader.from_buffer_copy(packet)
+        """Returns the next packet as a zero-copy view of a pooled buffer.
+
+        The packet overlays one of the listener's ring buffers and stays
+        valid for the next ``POOL_SIZE - 1`` receives; use ``get_copy``
+        if it needs to live longer than that.
+        """
+        return self._recv().from_buffer(self._buffer)
+
+    def get_copy(self):
+        """Returns the next packet as an independent copy."""
+        return self._recv().from_buffer_copy(self._buffer)
+
+    def get_batch(self, max_packets: int = 32):
+        """Drains pending datagrams, amortizing the per-wakeup overhead.
+
+        Blocks for the first packet, then keeps reading without blocking
+        until the kernel queue is empty or ``max_packets`` is reached.
+        The returned packets are independent copies.
+        """
+        packets = [self.get_copy()]
+
+        while len(packets) < max_packets:
+            if _MSG_DONTWAIT:
+                try:
+                    received = self.socket.recv_into(
+                        self._next_buffer(), BUFFER_SIZE, _MSG_DONTWAIT
+                    )
+                except BlockingIOError:
+                    # Nothing was received; give the slot back to the ring.
+                    self._pool_index = (self._pool_index - 1) % POOL_SIZE
+                    self._buffer = self._pool[self._pool_index]
+                    break
+            else:
+                if not select.select([self.socket], [], [], 0)[0]:
+                    break
+                received = self.socket.recv_into(self._next_buffer())
+
+            packet_type = self._dispatch(received)
+
+            if packet_type is None:
+                continue
 
-        key = (header.m_packet_format, header.m_packet_version, header.m_packet_id)
+            packets.append(packet_type.from_buffer_copy(self._buffer))
 
-        return HEADER_FIELD_TO_PACKET_TYPE[key].unpack(packet)
+        return packets
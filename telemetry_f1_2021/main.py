@@ -1,9 +1,10 @@
-import copy
-import json
-import pickle
+import queue
+import sys
+import threading
 from pathlib import Path
 
 from telemetry_f1_2021.packets import HEADER_FIELD_TO_PACKET_TYPE
+from telemetry_f1_2021.packets import configure_default_logging
 
 from telemetry_f1_2021.listener import TelemetryListener
 
@@ -18,51 +19,107 @@ def _get_listener():
         exit(127)
 
 
+def _receive_loop(listener, packet_queue):
+    """Drains the socket onto a queue so slow output never drops packets.
+
+    A failure is forwarded to the consumer instead of silently ending
+    the thread, which would leave the main loop blocked on an empty
+    queue forever.
+    """
+    while True:
+        try:
+            packet_queue.put(listener.get_copy())
+        except Exception as exception:
+            packet_queue.put(exception)
+            return
+
+
 def main():
+    configure_default_logging()
     listener = _get_listener()
 
+    # Receive on a dedicated thread: printing blocks on stdout, and any
+    # stall there used to back up into the kernel receive queue.
+    packet_queue = queue.SimpleQueue()
+    receiver = threading.Thread(
+        target=_receive_loop, args=(listener, packet_queue), daemon=True
+    )
+    receiver.start()
+
     try:
         while True:
-            packet = listener.get()
-            print(packet)
+            # Block for one packet, then fold whatever else is already
+            # queued into the same stdout write: a burst costs one
+            # write/flush instead of one per packet.
+            item = packet_queue.get()
+
+            if isinstance(item, Exception):
+                raise item
+
+            lines = [str(item)]
+
+            while len(lines) < 32:
+                try:
+                    item = packet_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                if isinstance(item, Exception):
+                    raise item
+
+                lines.append(str(item))
+
+            sys.stdout.write('\n'.join(lines) + '\n')
     except KeyboardInterrupt:
         print('Stop the car, stop the car Checo.')
         print('Stop the car, stop at pit exit.')
         print('Just pull over to the side.')
 
 
-def save_packets():
+def save_packets(emit_json=None):
+    configure_default_logging()
+
+    # JSON examples are opt-in: rendering 100-entry history arrays to
+    # text dominates capture time, while the .bin files are one write.
+    if emit_json is None:
+        emit_json = '--json' in sys.argv[1:]
+
     samples = {}
     listener = _get_listener()
-    packets_to_capture = copy.deepcopy(HEADER_FIELD_TO_PACKET_TYPE)
+    # Shallow copy: the values are class references, there is nothing to
+    # deep-copy, and the global mapping must stay intact for other users.
+    packets_to_capture = dict(HEADER_FIELD_TO_PACKET_TYPE)
 
     # remove FinalClassification and LobbyInfo
     for k in [(2021, 1, 8), (2021, 1, 9)]:
-        del HEADER_FIELD_TO_PACKET_TYPE[k]
+        del packets_to_capture[k]
 
-    while len(samples) != len(list(HEADER_FIELD_TO_PACKET_TYPE)):
-        packet = listener.get()
+    while packets_to_capture:
+        # get_copy: the samples are kept past the next receive.
+        packet = listener.get_copy()
 
-        key = (
-            packet.m_header.m_packet_format,
-            packet.m_header.m_packet_version,
-            packet.m_header.m_packet_id,
-        )
+        # The listener already dispatched on the header, so the class
+        # constant is the same key with zero ctypes field reads.
+        key = packet.HEADER_KEY
 
-        if key in list(packets_to_capture):
-            packet_type = HEADER_FIELD_TO_PACKET_TYPE[key].__name__
+        # O(1) dict membership; no throwaway key list per datagram.
+        if key in packets_to_capture:
+            packet_type = packets_to_capture.pop(key).__name__
             samples[packet_type] = packet
-            del packets_to_capture[key]
 
     root_dir = Path(__file__).parent
 
     for packet_name, packet in samples.items():
-        with open(f'{root_dir}/example_packets/{packet_name}.pickle', 'wb') as fh:
-            print(f'Saving packet: {root_dir}/example_packets/{packet_name}.pickle')
-            pickle.dump(packet, fh, protocol=pickle.HIGHEST_PROTOCOL)
-
-        with open(f'{root_dir}/example_packets/json/{packet_name}.json', 'w') as fh:
-            json.dump(packet.to_dict(), fh, indent=2)
+        # A packet is its wire format: raw bytes are the packet's exact
+        # size and reload with a single from_buffer_copy, with none of
+        # pickle's per-field encoding overhead or security exposure.
+        with open(f'{root_dir}/example_packets/{packet_name}.bin', 'wb') as fh:
+            fh.write(bytes(packet))
+
+        if emit_json:
+            with open(f'{root_dir}/example_packets/json/{packet_name}.json', 'w') as fh:
+                # to_json is orjson-backed when available.
+                fh.write(packet.to_json() + '\n')
 
     print('Done!')
 
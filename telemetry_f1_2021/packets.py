@@ -5,33 +5,339 @@ https://forums.codemasters.com/topic/
 
 """
 
+import collections
 import ctypes
+import functools
 import json
+import struct
+import sys
 
 import logging
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s.%(msecs)03d %(levelname)s: %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
+from typing import ClassVar, Dict, Optional, Tuple
+
+try:
+    import numpy
+except ImportError:
+    # numpy is optional; only the bulk/batch decoding helpers need it.
+    numpy = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; to_json falls back to the stdlib encoder.
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
 
+def configure_default_logging():
+    """Applies the default logging setup for the bundled CLI tools.
+
+    Importing this module no longer touches the root logger; library
+    consumers keep their own logging config and entrypoints call this.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s.%(msecs)03d %(levelname)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+
+_CTYPES_TO_NUMPY_FORMAT = {
+    ctypes.c_uint8: "u1",
+    ctypes.c_int8: "i1",
+    ctypes.c_uint16: "<u2",
+    ctypes.c_int16: "<i2",
+    ctypes.c_uint32: "<u4",
+    ctypes.c_int32: "<i4",
+    ctypes.c_uint64: "<u8",
+    ctypes.c_int64: "<i8",
+    ctypes.c_float: "<f4",
+    ctypes.c_double: "<f8",
+}
+
+
+_CTYPES_TO_STRUCT_FORMAT = {
+    ctypes.c_uint8: "B",
+    ctypes.c_int8: "b",
+    ctypes.c_uint16: "H",
+    ctypes.c_int16: "h",
+    ctypes.c_uint32: "I",
+    ctypes.c_int32: "i",
+    ctypes.c_uint64: "Q",
+    ctypes.c_int64: "q",
+    ctypes.c_float: "f",
+    ctypes.c_double: "d",
+}
+
+
+def _numpy_format(ctype):
+    """Translates a ctypes field type to a numpy format specifier."""
+    if issubclass(ctype, ctypes.Array):
+        if ctype._type_ is ctypes.c_char:
+            return f"S{ctype._length_}"
+
+        return (_numpy_format(ctype._type_), (ctype._length_,))
+
+    if issubclass(ctype, ctypes.Union):
+        # numpy has no union support, expose the raw bytes instead.
+        return f"V{ctypes.sizeof(ctype)}"
+
+    if issubclass(ctype, PacketMixin):
+        return ctype.numpy_dtype()
+
+    return _CTYPES_TO_NUMPY_FORMAT[ctype]
+
+
+def _identity(value):
+    return value
+
+
+def _round_float(value):
+    return round(value, 3)
+
+
+# Name fields (drivers, teams) cycle through a handful of values, so
+# decoding allocates the same str over and over; interning collapses the
+# repeats to one shared object. The cap only matters if a stream floods
+# unique values - growth just stops, decoding still works.
+_NAME_CACHE: Dict[bytes, str] = {}
+_NAME_CACHE_MAX = 1024
+
+
+def _decode_bytes(value):
+    name = _NAME_CACHE.get(value)
+
+    if name is None:
+        name = sys.intern(value.decode())
+
+        if len(_NAME_CACHE) < _NAME_CACHE_MAX:
+            _NAME_CACHE[value] = name
+
+    return name
+
+
+def _format_packet(value):
+    return value.to_dict()
+
+
+# Exact-type dispatch for the generic formatting fallback: one dict
+# lookup instead of an isinstance chain per field.
+_FORMATTERS = {
+    float: _round_float,
+    bytes: _decode_bytes,
+}
+
+
+def _format_packet_array(value):
+    return [item.to_dict() for item in value]
+
+
+def _formatter_for(ctype):
+    """Picks the formatter for a field's ctypes type at class creation.
+
+    The ctypes field types are known statically, so each field can be
+    bound to a single formatter once instead of re-running the
+    ``_format_type`` branch chain on every value.
+    """
+    if issubclass(ctype, ctypes.Array):
+        if ctype._type_ is ctypes.c_char:
+            return _decode_bytes
+
+        if issubclass(ctype._type_, PacketMixin):
+            return _format_packet_array
+
+        if ctype._length_ <= 8:
+            # The wheel-quad arrays (c_float * 4, c_uint8 * 4, ...) are
+            # too small for numpy to pay off; one struct unpack beats
+            # per-element ctypes boxing and the frombuffer overhead.
+            unpacker = struct.Struct(
+                f"<{ctype._length_}{_CTYPES_TO_STRUCT_FORMAT[ctype._type_]}"
+            )
+
+            def _format_small_array(value, _unpack=unpacker.unpack_from):
+                return list(_unpack(value))
+
+            return _format_small_array
+
+        if numpy is not None:
+            # One C-level view + tolist() instead of boxing each element
+            # through ctypes; output is the same plain list of scalars.
+            dtype = numpy.dtype(_CTYPES_TO_NUMPY_FORMAT[ctype._type_])
+
+            def _format_scalar_array(value, _dtype=dtype):
+                return numpy.frombuffer(value, dtype=_dtype).tolist()
+
+            return _format_scalar_array
+
+        return list
+
+    if issubclass(ctype, (ctypes.c_float, ctypes.c_double)):
+        return _round_float
+
+    if issubclass(ctype, PacketMixin):
+        return _format_packet
+
+    return _identity
+
+
+def _compile_to_dict(cls):
+    """Code-generates a ``to_dict`` specialized to the class layout.
+
+    The schema is fixed at class creation, so the generic loop over
+    field names and formatters can be partially evaluated into a single
+    dict literal with the scalar conversions inlined. Removes the
+    per-field dispatch and the generator frame from the hot path.
+    """
+    namespace = {}
+    parts = []
+    limits = getattr(cls, "_array_limits", None) or {}
+
+    for index, (name, ctype) in enumerate(zip(cls._field_names, cls._field_types)):
+        if issubclass(ctype, ctypes.Array):
+            if ctype._type_ is ctypes.c_char:
+                namespace["_decode_bytes"] = _decode_bytes
+                expression = f"_decode_bytes(self.{name})"
+            elif issubclass(ctype._type_, PacketMixin):
+                count = limits.get(name)
+
+                if count:
+                    expression = (
+                        f"[item.to_dict() for item in self.{name}[:self.{count}]]"
+                    )
+                else:
+                    expression = f"[item.to_dict() for item in self.{name}]"
+            else:
+                formatter = f"_format_{name}"
+                namespace[formatter] = cls._field_formatters[index]
+                expression = f"{formatter}(self.{name})"
+        elif issubclass(ctype, (ctypes.c_float, ctypes.c_double)):
+            expression = f"round(self.{name}, 3)"
+        elif issubclass(ctype, PacketMixin):
+            expression = f"self.{name}.to_dict()"
+        else:
+            expression = f"self.{name}"
+
+        parts.append(f'        "{name}": {expression},')
+
+    source = "def to_dict(self):\n    return {\n" + "\n".join(parts) + "\n    }\n"
+    exec(source, namespace)
+
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{cls.__name__}.to_dict"
+    to_dict.__doc__ = PacketMixin.to_dict.__doc__
+
+    return to_dict
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2
+
+# Stdlib dumper with the invariant options bound once instead of three
+# dict mutations per call. No sort_keys: the dicts are built in
+# _fields_ declaration order, which is already deterministic per class
+# and matches the spec's field order, so sorting per dump is pure cost.
+_dumps = functools.partial(
+    json.dumps,
+    indent=2,
+    ensure_ascii=False,
+    separators=(",", ": "),
+)
+
+
 def to_json(*args, **kwargs):
+    if not kwargs and len(args) == 1:
+        if orjson is not None:
+            return orjson.dumps(args[0], option=_ORJSON_OPTIONS).decode()
+
+        return _dumps(args[0])
+
     kwargs.setdefault("indent", 2)
 
-    kwargs["sort_keys"] = True
     kwargs["ensure_ascii"] = False
     kwargs["separators"] = (",", ": ")
 
     return json.dumps(*args, **kwargs)
 
 
+# Pre-rendered strings for the single-byte enum/flag fields that dominate
+# the packets, so streaming them skips an int-to-str conversion each.
+_INT_STR_CACHE = tuple(str(value) for value in range(-128, 256))
+
+
+def _write_json_value(value, write, round_floats=True):
+    """Writes one field value as a JSON token stream.
+
+    Floats inside arrays are emitted untouched to match what to_dict
+    produces for primitive arrays; scalar fields are rounded the same
+    way the scalar formatter does.
+    """
+    if isinstance(value, float):
+        # format() emits the final 3-decimal token in one C call; going
+        # through round() first would pay the banker-rounding path and a
+        # second stringification for the same digits.
+        write(format(value, ".3f") if round_floats else repr(value))
+    elif isinstance(value, int):
+        write(_INT_STR_CACHE[value + 128] if -128 <= value < 256 else str(value))
+    elif isinstance(value, bytes):
+        write(json.dumps(value.decode(), ensure_ascii=False))
+    elif isinstance(value, (ctypes.Array, list)):
+        write("[")
+
+        for index, item in enumerate(value):
+            if index:
+                write(", ")
+            _write_json_value(item, write, round_floats=False)
+
+        write("]")
+    else:
+        _write_json_packet(value, write)
+
+
+def _write_json_packet(packet, write):
+    # The keys carry their separators ('{"a": ', then ', "b": '), so the
+    # loop is write-value pairs with no per-field branching.
+    limits = packet._array_limits
+
+    for name, key in zip(packet._field_names, packet._json_keys):
+        write(key)
+        value = getattr(packet, name)
+
+        if limits is not None and name in limits:
+            value = value[: getattr(packet, limits[name])]
+
+        _write_json_value(value, write)
+
+    write("}")
+
+
 class PacketMixin(object):
     """A base set of helper methods for ctypes based packets"""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        fields = cls.__dict__.get("_fields_")
+
+        if fields:
+            # Cache the field names once per class so the serialization
+            # paths don't re-walk ``_fields_`` tuples on every call.
+            cls._field_names = tuple(name for name, _ in fields)
+            cls._field_types = tuple(ctype for _, ctype in fields)
+            cls._field_formatters = tuple(
+                _formatter_for(ctype) for ctype in cls._field_types
+            )
+            # Pre-rendered '{"key": ' / ', "key": ' tokens for the JSON
+            # streamer: no string formatting per field at write time.
+            cls._json_keys = tuple(
+                ('{' if index == 0 else ', ') + f'"{name}": '
+                for index, name in enumerate(cls._field_names)
+            )
+
+            if "to_dict" not in cls.__dict__:
+                cls.to_dict = _compile_to_dict(cls)
+
     def get_value(self, field):
         """Returns the field's value and formats the types value"""
         return self._format_type(getattr(self, field))
@@ -44,11 +350,23 @@ class PacketMixin(object):
                 - The packed binary
 
         """
-        return bytes(self)
+        # One memcpy from the raw storage; bytes(self) walks the field
+        # descriptors to build the same buffer.
+        return ctypes.string_at(ctypes.addressof(self), self._size)
+
+    def as_memoryview(self):
+        """Returns a zero-copy byte view of the packet's storage.
+
+        For send-through paths - ``socket.sendto(packet.as_memoryview(),
+        addr)``, file writes, hashing - this skips even the single
+        memcpy of ``pack``. The view is writable and shares the packet's
+        memory, so it must not outlive the packet.
+        """
+        return memoryview(self).cast('B')
 
     @classmethod
     def size(cls):
-        return ctypes.sizeof(cls)
+        return cls._size
 
     @classmethod
     def unpack(cls, buffer):
@@ -61,28 +379,292 @@ class PacketMixin(object):
         """
         return cls.from_buffer_copy(buffer)
 
+    @classmethod
+    def unpack_from(cls, buffer, offset=0):
+        """Overlays the structure onto a writable buffer without copying.
+
+        Unlike ``unpack`` no bytes are copied: the returned packet shares
+        memory with ``buffer`` (a ``bytearray``, ``mmap``, ctypes array,
+        ...), which must outlive it. The right choice when the caller
+        owns a persistent receive buffer or a mapped replay file.
+        """
+        return cls.from_buffer(buffer, offset)
+
+    @classmethod
+    def numpy_dtype(cls):
+        """Returns a ``numpy.dtype`` mirroring the packet's wire layout.
+
+        Built once per class on first use; ``_pack_ = 1`` means the ctypes
+        and numpy layouts match byte-for-byte. Requires numpy.
+        """
+        dtype = cls.__dict__.get("_np_dtype")
+
+        if dtype is None:
+            if numpy is None:
+                raise ModuleNotFoundError(
+                    "numpy is required for the bulk decoding helpers"
+                )
+
+            dtype = numpy.dtype(
+                {
+                    "names": list(cls._field_names),
+                    "formats": [_numpy_format(t) for t in cls._field_types],
+                    "offsets": [getattr(cls, n).offset for n in cls._field_names],
+                    "itemsize": ctypes.sizeof(cls),
+                }
+            )
+            cls._np_dtype = dtype
+
+        return dtype
+
+    @classmethod
+    def as_ndarray(cls, buffer):
+        """Views a buffer of one or more packets as a numpy structured array.
+
+        Zero-copy: the returned array shares memory with ``buffer``. For
+        log-file replay this decodes a whole capture in one C-level call
+        instead of one ``from_buffer_copy`` per packet.
+        """
+        return numpy.frombuffer(buffer, dtype=cls.numpy_dtype())
+
+    @classmethod
+    def unpack_np(cls, buffer):
+        """Parses one packet from ``buffer`` as a numpy structured scalar.
+
+        The numpy counterpart of ``unpack``: one C-level parse of the
+        whole datagram instead of a ctypes object whose every field read
+        goes through a Python descriptor. Sub-arrays such as
+        ``record['m_car_motion_data']`` come back columnar and feed
+        straight into vectorised code. Requires numpy.
+        """
+        return numpy.frombuffer(buffer, dtype=cls.numpy_dtype(), count=1)[0]
+
+    @classmethod
+    def unpack_batch(cls, buffer, count=-1):
+        """Unpacks consecutive packets of this type from one buffer.
+
+        Args:
+            buffer (bytes):
+                - Concatenated raw packets, e.g. a whole session log.
+            count (int):
+                - Number of packets to take, all of them by default.
+
+        Returns a zero-copy numpy structured array; per-field access like
+        ``batch['m_header']['m_session_time']`` is columnar, so aggregate
+        stats run vectorised instead of packet-by-packet. Requires numpy.
+        """
+        return numpy.frombuffer(buffer, dtype=cls.numpy_dtype(), count=count)
+
+    def to_ndarray(self):
+        """Views this live packet as a numpy structured record.
+
+        Zero-copy: the record shares the packet's memory, so numeric
+        consumers can hand fields (or whole sub-arrays such as
+        ``record['m_car_motion_data']``) to vectorised numpy code
+        without walking 22 cars through ctypes attribute reads.
+        Requires numpy.
+        """
+        return numpy.frombuffer(self, dtype=self.__class__.numpy_dtype())[0]
+
+    def soa(self, field_name):
+        """Re-exposes an array-of-structs field as per-field numpy columns.
+
+        The 22-car arrays (and the lap-history array) are laid out AoS,
+        so scanning one field strides over whole records. The returned
+        ``{field: ndarray}`` views share this packet's memory and give
+        contiguous per-field access for vectorised reductions, e.g.
+        ``packet.soa('m_car_motion_data')['m_g_force_lateral'].mean()``.
+        Requires numpy.
+        """
+        cls = self.__class__
+        ctype = cls._field_types[cls._field_names.index(field_name)]
+
+        if not (
+            issubclass(ctype, ctypes.Array) and issubclass(ctype._type_, PacketMixin)
+        ):
+            raise ValueError(f"{field_name} is not an array of packet structs")
+
+        element = ctype._type_
+        records = numpy.frombuffer(
+            self,
+            dtype=element.numpy_dtype(),
+            count=ctype._length_,
+            offset=getattr(cls, field_name).offset,
+        )
+
+        return {name: records[name] for name in element._field_names}
+
     def to_dict(self):
         """Returns a ``dict`` with key-values derived from _fields_"""
-        return {k: self.get_value(k) for k, _ in self._fields_}
+        return {
+            name: formatter(getattr(self, name))
+            for name, formatter in zip(self._field_names, self._field_formatters)
+        }
+
+    def to_namedtuple(self):
+        """Returns a ``namedtuple`` with values derived from _fields_
+
+        Lighter than ``to_dict`` for consumers that only read a few
+        fields: no dict allocation, attribute access is tuple indexing.
+        The namedtuple class is generated once per packet class.
+        """
+        cls = self.__class__
+        nt = cls.__dict__.get("_NT")
+
+        if nt is None:
+            nt = collections.namedtuple(cls.__name__ + "Tuple", cls._field_names)
+            cls._NT = nt
+
+        return nt._make(
+            formatter(getattr(self, name))
+            for name, formatter in zip(self._field_names, self._field_formatters)
+        )
+
+    # Stamped onto every registered packet class at module bottom, once
+    # ctypes has finalized the layouts.
+    PACKET_ID: ClassVar[int]
+    HEADER_KEY: ClassVar[Tuple[int, int, int]]
+    _size: ClassVar[int]
+
+    # Maps array field -> count field for classes whose arrays are only
+    # populated up to a declared count; serializers stop at the count.
+    _array_limits: ClassVar[Optional[Dict[str, str]]] = None
+
+    # Whole-packet wire format, compiled at module bottom; None for
+    # classes containing a Union, whose overlapping fields have no
+    # single flat encoding.
+    _struct: ClassVar[Optional[struct.Struct]] = None
+    _flat_fields: ClassVar[Optional[Tuple[str, ...]]] = None
+
+    def fast_values(self):
+        """Returns every wire field as one flat tuple of raw values.
+
+        A single C-level unpack of the whole packet, against hundreds of
+        ctypes descriptor lookups for field-by-field access. Nested
+        structures and arrays are flattened in declaration order
+        (``_flat_fields`` names each position); values are raw - no
+        float rounding, no name decoding. The bulk-read path for
+        consumers that touch most of a packet.
+        """
+        return self._struct.unpack_from(self)
+
+    @classmethod
+    def _field_readers(cls):
+        """Builds (and caches) per-field (Struct, offset, is_scalar) readers.
+
+        Covers scalar fields, name strings and scalar arrays; nested
+        structure fields have no single-read encoding and are omitted.
+        Built on first use because ctypes only exposes field offsets
+        once the class layout is finalized.
+        """
+        readers = cls.__dict__.get("_reader_table")
+
+        if readers is None:
+            readers = {}
+
+            for name, ctype in zip(cls._field_names, cls._field_types):
+                offset = getattr(cls, name).offset
+
+                if issubclass(ctype, ctypes.Array):
+                    element = ctype._type_
+
+                    if element is ctypes.c_char:
+                        reader = struct.Struct(f"<{ctype._length_}s"), offset, True
+                    elif element in _CTYPES_TO_STRUCT_FORMAT:
+                        fmt = "<" + _CTYPES_TO_STRUCT_FORMAT[element] * ctype._length_
+                        reader = struct.Struct(fmt), offset, False
+                    else:
+                        continue
+                elif ctype in _CTYPES_TO_STRUCT_FORMAT:
+                    fmt = "<" + _CTYPES_TO_STRUCT_FORMAT[ctype]
+                    reader = struct.Struct(fmt), offset, True
+                else:
+                    continue
+
+                readers[name] = reader
+
+            cls._reader_table = readers
+
+        return readers
+
+    @classmethod
+    def field_from_buf(cls, buffer, name, offset=0):
+        """Reads a single field straight out of a raw datagram.
+
+        Cherry-picking one value - a packet id, a session time, one
+        car's speed - touches only that field's bytes instead of
+        overlaying the whole packet and firing a ctypes descriptor.
+        Scalars come back as plain values, scalar arrays as tuples;
+        nested structure fields raise ValueError (unpack those via
+        ``unpack_from`` or the numpy views).
+        """
+        reader = cls._field_readers().get(name)
+
+        if reader is None:
+            raise ValueError(f"{name} is not a flat-readable field of {cls.__name__}")
+
+        field_struct, field_offset, is_scalar = reader
+        values = field_struct.unpack_from(buffer, offset + field_offset)
+
+        return values[0] if is_scalar else values
+
+    @classmethod
+    def unpack_tuple(cls, buffer, offset=0):
+        """Unpacks raw field values from a buffer, skipping ctypes entirely.
+
+        The decode twin of ``fast_values``: one precompiled unpack
+        straight off the wire, no object construction. Cheapest way to
+        read the small event payloads (FastestLap, SpeedTrap, ...)
+        where building a ctypes instance costs more than the decode.
+        """
+        return cls._struct.unpack_from(buffer, offset)
+
+    @classmethod
+    def unpack_flat(cls, buffer, offset=0):
+        """Unpacks a datagram into a flat namedtuple of raw values.
+
+        ``unpack_tuple`` with names: one C-level unpack, then attribute
+        access is tuple indexing (``flat.m_header_m_session_time``,
+        ``flat.m_lap_data_0_m_car_position``) - no ctypes descriptors,
+        no per-field objects retained. The namedtuple class is generated
+        once per packet class from ``_flat_fields``.
+        """
+        nt = cls.__dict__.get("_FlatNT")
+
+        if nt is None:
+            nt = collections.namedtuple(cls.__name__ + "Flat", cls._flat_fields)
+            cls._FlatNT = nt
+
+        return nt._make(cls._struct.unpack_from(buffer, offset))
 
     def to_json(self):
-        """Returns a ``str`` of sorted JSON derived from _fields_"""
+        """Returns a ``str`` of JSON in _fields_ declaration order"""
         return to_json(self.to_dict())
 
+    def write_json(self, out):
+        """Streams this packet as compact JSON into a text file object.
+
+        One walk over the fields with values written as they are read -
+        no intermediate dict tree. Keys are in declaration order.
+        """
+        _write_json_packet(self, out.write)
+
     def _format_type(self, value):
         """A type helper to format values"""
-        class_name = type(value).__name__
+        # Most fields are uint8/uint16: pass ints through untouched
+        # before paying for any dispatch at all.
+        if type(value) is int:
+            return value
 
-        if class_name == "float":
-            return round(value, 3)
+        formatter = _FORMATTERS.get(type(value))
 
-        if class_name == "bytes":
-            return value.decode()
+        if formatter is not None:
+            return formatter(value)
 
         if isinstance(value, ctypes.Array):
             return _format_array_type(value)
 
-        if hasattr(value, "to_dict"):
+        if isinstance(value, PacketMixin):
             return value.to_dict()
 
         return value
@@ -109,7 +691,20 @@ class Packet(ctypes.LittleEndianStructure, PacketMixin):
         return self.to_json()
 
 
+# Wire layout of PacketHeader, precompiled once for the dispatch path.
+_HEADER_STRUCT = struct.Struct("<HBBBBQfIBB")
+
+
 class PacketHeader(Packet):
+    @classmethod
+    def peek(cls, buffer):
+        """Unpacks the header fields to a tuple without building a ctypes object.
+
+        Useful to route a datagram on ``m_packet_id`` (index 4 of the
+        returned tuple) before deciding whether to pay for a full unpack.
+        """
+        return _HEADER_STRUCT.unpack_from(buffer)
+
     _fields_ = [
         ("m_packet_format", ctypes.c_uint16),  # 2021
         ("m_game_major_version", ctypes.c_uint8),  # Game major version - "X.00"
@@ -158,6 +753,10 @@ class CarMotionData(Packet):
 
 
 class PacketMotionData(Packet):
+    # _anonymous_ (here and on every packet below) promotes the header's
+    # fields onto the packet: one ctypes descriptor hop for m_packet_id
+    # and friends instead of two. m_header itself stays accessible.
+    _anonymous_ = ("m_header",)
     _fields_ = [
         ("m_header", PacketHeader),  # Header
         ("m_car_motion_data", CarMotionData * 22),  # Data for all cars on track
@@ -181,6 +780,17 @@ class PacketMotionData(Packet):
         # Current front wheels angle in radians
     ]
 
+    def to_soa(self):
+        """Returns the 22-car motion array as per-field numpy columns.
+
+        Shorthand over ``soa`` for the packet analytics reach for most:
+        ``packet.to_soa()['m_g_force_lateral'].mean()`` is one
+        vectorised pass over contiguous floats instead of 22 strided
+        ctypes reads. The columns view this packet's memory directly.
+        Requires numpy.
+        """
+        return self.soa('m_car_motion_data')
+
 
 class MarshalZone(Packet):
     _fields_ = [
@@ -212,6 +822,14 @@ class WeatherForecastSample(Packet):
 
 
 class PacketSessionData(Packet):
+    # Only the first m_num_* entries of these arrays carry data; the
+    # serializers stop there instead of walking the padded tail.
+    _array_limits = {
+        "m_marshal_zones": "m_num_marshal_zones",
+        "m_weather_forecast_samples": "m_num_weather_forecast_samples",
+    }
+
+    _anonymous_ = ("m_header",)
     _fields_ = [
         ("m_header", PacketHeader),  # Header
         ("m_weather", ctypes.c_uint8),
@@ -323,6 +941,7 @@ class LapData(Packet):
 
 
 class PacketLapData(Packet):
+    _anonymous_ = ("m_header",)
     _fields_ = [
         ("m_header", PacketHeader),  # Header
         ("m_lap_data", LapData * 22),  # Lap data for all cars on track
@@ -416,6 +1035,27 @@ class Buttons(Packet):
         # currently - see appendices
     ]
 
+    def pressed_indices(self):
+        """Returns the bit indices of the currently pressed buttons.
+
+        Walks only the set bits (isolate the lowest with ``x & -x``,
+        clear it, repeat) instead of testing all 32 positions - usually
+        zero or one iteration per event.
+        """
+        status = self.m_button_status
+        indices = []
+
+        while status:
+            bit = status & -status
+            indices.append(bit.bit_length() - 1)
+            status ^= bit
+
+        return indices
+
+    def any_of(self, mask):
+        """Returns whether any button in the given bit mask is pressed."""
+        return bool(self.m_button_status & mask)
+
 
 class EventDataDetails(ctypes.Union, PacketMixin):
     _fields_ = [
@@ -434,6 +1074,7 @@ class EventDataDetails(ctypes.Union, PacketMixin):
 
 
 class PacketEventData(Packet):
+    _anonymous_ = ("m_header",)
     _fields_ = [
         ("m_header", PacketHeader),  # Header
         ("m_event_string_code", ctypes.c_uint8 * 4),  # Event string code, see below
@@ -464,6 +1105,9 @@ class ParticipantData(Packet):
 
 
 class PacketParticipantsData(Packet):
+    _array_limits = {"m_participants": "m_num_active_cars"}
+
+    _anonymous_ = ("m_header",)
     _fields_ = [
         ("m_header", PacketHeader),  # Header
         ("m_num_active_cars", ctypes.c_uint8),
@@ -506,6 +1150,7 @@ class CarSetupData(Packet):
 
 
 class PacketCarSetupData(Packet):
+    _anonymous_ = ("m_header",)
     _fields_ = [
         ("m_header", PacketHeader),  # Header
         ("m_car_setups", CarSetupData * 22),
@@ -538,6 +1183,7 @@ class CarTelemetryData(Packet):
 
 
 class PacketCarTelemetryData(Packet):
+    _anonymous_ = ("m_header",)
     _fields_ = [
         ("m_header", PacketHeader),  # Header
         ("m_car_telemetry_data", CarTelemetryData * 22),
@@ -551,6 +1197,24 @@ class PacketCarTelemetryData(Packet):
         # 0 if no gear suggested
     ]
 
+    @classmethod
+    def decode_cars(cls, buffer):
+        """Decodes the 22 car records from a raw datagram into numpy.
+
+        One C-level parse straight off the wire bytes - no ctypes packet
+        in between - returning a structured array whose columns
+        (``cars['m_speed']``, ``cars['m_tyres_surface_temperature']``)
+        feed vectorised aggregation directly. The packet arrives at the
+        highest rate of the stream, so this is the cheapest route from
+        datagram to statistics. Requires numpy.
+        """
+        return numpy.frombuffer(
+            buffer,
+            dtype=CarTelemetryData.numpy_dtype(),
+            count=22,
+            offset=cls.m_car_telemetry_data.offset,
+        )
+
 
 class CarStatusData(Packet):
     _fields_ = [
@@ -604,6 +1268,7 @@ class CarStatusData(Packet):
 
 
 class PacketCarStatusData(Packet):
+    _anonymous_ = ("m_header",)
     _fields_ = [
         ("m_header", PacketHeader),  # Header
         ("m_car_status_data", CarStatusData * 22),
@@ -637,6 +1302,9 @@ class FinalClassificationData(Packet):
 
 
 class PacketFinalClassificationData(Packet):
+    _array_limits = {"m_classification_data": "m_num_cars"}
+
+    _anonymous_ = ("m_header",)
     _fields_ = [
         ("m_header", PacketHeader),  # Header
         ("m_num_cars", ctypes.c_uint8),  # Number of cars in the final classification
@@ -660,6 +1328,9 @@ class LobbyInfoData(Packet):
 
 
 class PacketLobbyInfoData(Packet):
+    _array_limits = {"m_lobby_players": "m_num_players"}
+
+    _anonymous_ = ("m_header",)
     _fields_ = [
         ("m_header", PacketHeader),  # Header
         # Packet specific data
@@ -694,6 +1365,7 @@ class CarDamageData(Packet):
 
 
 class PacketCarDamageData(Packet):
+    _anonymous_ = ("m_header",)
     _fields_ = [
         ("m_header", PacketHeader),  # Header
         ("m_car_damage_data", CarDamageData * 22),
@@ -721,7 +1393,24 @@ class TyreStintHistoryData(Packet):
     ]
 
 
+SessionHistorySoA = collections.namedtuple('SessionHistorySoA', ['laps', 'tyre_stints'])
+
+
 class PacketSessionHistoryData(Packet):
+    def as_soa(self):
+        """Returns the lap-history and tyre-stint arrays as SoA columns.
+
+        Shorthand over ``soa`` for the analytics-heavy history packet:
+        ``packet.as_soa().laps['m_sector2_time_in_ms'].min()`` touches
+        200 contiguous bytes instead of striding 100 twelve-byte
+        records through ctypes. Requires numpy.
+        """
+        return SessionHistorySoA(
+            laps=self.soa('m_lap_history_data'),
+            tyre_stints=self.soa('m_tyre_stints_history_data'),
+        )
+
+    _anonymous_ = ("m_header",)
     _fields_ = [
         ("m_header", PacketHeader),  # Header
         ("m_car_idx", ctypes.c_uint8),  # Index of the car this lap data relates to
@@ -755,3 +1444,180 @@ HEADER_FIELD_TO_PACKET_TYPE = {
     (2021, 1, 10): PacketCarDamageData,
     (2021, 1, 11): PacketSessionHistoryData,
 }
+
+# Registration-time dispatch metadata: each class knows its id and its
+# (format, version, id) key as plain class attributes, so routing and
+# bookkeeping code reads a constant instead of the header fields.
+for _key, _packet_cls in HEADER_FIELD_TO_PACKET_TYPE.items():
+    _packet_cls.PACKET_ID = _key[2]
+    _packet_cls.HEADER_KEY = _key
+
+del _key, _packet_cls
+
+# Flat packet_id -> class lookup for the 2021/v1 stream. Dispatching on
+# m_packet_id is one index into a frozen tuple - no hash, no branch
+# chain - once the caller has checked the packet format.
+PACKET_BY_ID = tuple(HEADER_FIELD_TO_PACKET_TYPE.get((2021, 1, i)) for i in range(16))
+
+
+# Byte offsets of the dispatch fields inside every datagram (header
+# layout <HBBBBQfIBB): reading them by index routes a datagram without
+# unpacking the header at all.
+PACKET_FORMAT_OFFSET = 0
+PACKET_ID_OFFSET = 5
+
+# 2021 as the header's little-endian uint16 bytes, for the byte-wise
+# format check that goes with the offsets above.
+PACKET_FORMAT_2021_LE = tuple((2021).to_bytes(2, "little"))
+
+
+def _make_parser(cls):
+    def _parse(buffer, _unpack=cls.from_buffer_copy):
+        return _unpack(buffer)
+
+    return _parse
+
+
+# Per-id parse functions with the unpack entry point pre-bound as a
+# default argument: dispatch is one tuple index and one call, with no
+# attribute lookups on the per-datagram path.
+_PARSERS = tuple(None if cls is None else _make_parser(cls) for cls in PACKET_BY_ID)
+
+
+class LazyPacket:
+    """A datagram held as raw bytes until a field is actually read.
+
+    Pass-through consumers (log to disk, forward over the network) never
+    need the parse at all: ``pack`` returns the stored bytes untouched
+    and only the first attribute read pays for ``from_buffer_copy``,
+    after which access delegates to the parsed packet. Session-history
+    forwarding in particular stays O(1) regardless of the 100-lap
+    payload.
+    """
+
+    __slots__ = ("packet_id", "raw", "_packet")
+
+    def __init__(self, packet_id, raw):
+        self.packet_id = packet_id
+        self.raw = bytes(raw)
+        self._packet = None
+
+    def packet(self):
+        """Parses and returns the full packet, caching the result."""
+        if self._packet is None:
+            self._packet = PACKET_BY_ID[self.packet_id].from_buffer_copy(self.raw)
+
+        return self._packet
+
+    def pack(self):
+        return self.raw
+
+    def __getattr__(self, name):
+        return getattr(self.packet(), name)
+
+
+def parse_packet(buffer):
+    """Parses a raw UDP datagram into the matching packet object.
+
+    One entry point for the receive path: routes on two byte reads
+    (format, id) without unpacking the header, then the pre-bound
+    parser does the single full unpack. Non-2021 streams fall back to
+    the header peek and the (format, version, id) mapping.
+    """
+    if (
+        buffer[PACKET_FORMAT_OFFSET] == PACKET_FORMAT_2021_LE[0]
+        and buffer[PACKET_FORMAT_OFFSET + 1] == PACKET_FORMAT_2021_LE[1]
+    ):
+        packet_id = buffer[PACKET_ID_OFFSET]
+        parser = _PARSERS[packet_id] if packet_id < len(_PARSERS) else None
+
+        if parser is None:
+            raise KeyError(f"no packet class for 2021 packet id {packet_id}")
+
+        return parser(buffer)
+
+    header = _HEADER_STRUCT.unpack_from(buffer)
+
+    return HEADER_FIELD_TO_PACKET_TYPE[header[0], header[3], header[4]].unpack(buffer)
+
+
+# ctypes.sizeof walks the descriptor tree on every call, so compute it once
+# per class now that all layouts are final. ``__init_subclass__`` runs before
+# ctypes has processed ``_fields_``, hence the pass down here.
+for _packet_cls in list(globals().values()):
+    if (
+        isinstance(_packet_cls, type)
+        and issubclass(_packet_cls, PacketMixin)
+        and "_fields_" in _packet_cls.__dict__
+    ):
+        # issubclass narrows to PacketMixin and loses the ctypes base.
+        _packet_cls._size = ctypes.sizeof(_packet_cls)  # type: ignore[arg-type]
+
+del _packet_cls
+
+# Expected datagram length per packet id, aligned with PACKET_BY_ID.
+# A datagram whose length doesn't match is truncated or corrupt; one
+# integer compare catches that before any unpacking starts.
+SIZE_BY_ID = tuple(cls._size if cls else 0 for cls in PACKET_BY_ID)
+
+
+def _build_struct(cls):
+    """Compiles the flattened wire format of ``cls`` into one Struct.
+
+    Returns ``(struct, flat_names)`` where the names mirror the struct's
+    positions: nested structures are prefixed (``m_header_m_packet_id``)
+    and array elements indexed (``m_lap_data_0_m_car_position``).
+    Returns ``(None, None)`` for classes containing a Union.
+    """
+    parts = []
+    names = []
+
+    def walk(fields, prefix):
+        for name, ctype in fields:
+            flat = prefix + name
+
+            if issubclass(ctype, ctypes.Union):
+                return False
+
+            if issubclass(ctype, ctypes.Structure):
+                if not walk(ctype._fields_, flat + '_'):
+                    return False
+            elif issubclass(ctype, ctypes.Array):
+                element = ctype._type_
+
+                if element is ctypes.c_char:
+                    parts.append(f'{ctype._length_}s')
+                    names.append(flat)
+                elif issubclass(element, ctypes.Union):
+                    return False
+                elif issubclass(element, ctypes.Structure):
+                    for index in range(ctype._length_):
+                        if not walk(element._fields_, f'{flat}_{index}_'):
+                            return False
+                else:
+                    parts.append(_CTYPES_TO_STRUCT_FORMAT[element] * ctype._length_)
+                    names.extend(f'{flat}_{index}' for index in range(ctype._length_))
+            else:
+                parts.append(_CTYPES_TO_STRUCT_FORMAT[ctype])
+                names.append(flat)
+
+        return True
+
+    if issubclass(cls, ctypes.Union) or not walk(cls.__dict__['_fields_'], ''):
+        return None, None
+
+    compiled = struct.Struct('<' + ''.join(parts))
+    assert compiled.size == cls._size, cls.__name__
+
+    return compiled, tuple(names)
+
+
+for _packet_cls in list(globals().values()):
+    if (
+        isinstance(_packet_cls, type)
+        and issubclass(_packet_cls, PacketMixin)
+        and "_fields_" in _packet_cls.__dict__
+    ):
+        _packet_cls._struct, _packet_cls._flat_fields = _build_struct(_packet_cls)
+
+del _packet_cls
@@ -0,0 +1,30 @@
+import pickle
+import socket
+from pathlib import Path
+
+from telemetry_f1_2021.listener import TelemetryListener
+from telemetry_f1_2021.packets import PacketLapData
+
+EXAMPLE_PACKETS = Path(__file__).parent.parent / 'telemetry_f1_2021' / 'example_packets'
+
+
+def test_listener_drops_truncated_datagrams():
+    listener = TelemetryListener(host='127.0.0.1', port=20877)
+
+    with open(EXAMPLE_PACKETS / 'PacketLapData.pickle', 'rb') as raw_data:
+        data = bytes(pickle.load(raw_data))
+
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        # The truncated datagram must be dropped by the length gate and
+        # the next valid one returned in its place.
+        sender.sendto(data[:100], ('127.0.0.1', 20877))
+        sender.sendto(data, ('127.0.0.1', 20877))
+
+        packet = listener.get()
+
+        assert isinstance(packet, PacketLapData)
+        assert bytes(packet) == data
+    finally:
+        sender.close()
+        listener.socket.close()
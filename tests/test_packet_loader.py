@@ -1,7 +1,29 @@
-from telemetry_f1_2021.example_packets.loader import PacketLoader
+import os
+import pickle
+
+import pytest
+
+from telemetry_f1_2021.example_packets.loader import PacketLoader, SafeUnpickler
+from telemetry_f1_2021.packets import PacketMixin
 
 
 def test_packet_loader():
     pl = PacketLoader()
     packets = pl.fetch_packets()
     print(packets.keys())
+
+
+def test_packet_loader_loads_example_packets():
+    packets = PacketLoader().fetch_packets()
+
+    assert len(packets) == 10
+    assert all(isinstance(packet, PacketMixin) for packet in packets.values())
+
+
+def test_safe_unpickler_rejects_unknown_globals(tmp_path):
+    evil = tmp_path / 'evil.pickle'
+    evil.write_bytes(pickle.dumps(os.system))
+
+    with open(evil, 'rb') as raw_data:
+        with pytest.raises(pickle.UnpicklingError):
+            SafeUnpickler(raw_data).load()